@@ -1,7 +1,13 @@
 from IPython.display import  clear_output
 import random
+import sys
+
+# only draw the board when someone is watching (terminal or notebook)
+INTERACTIVE = sys.stdout.isatty() or 'ipykernel' in sys.modules
 
 def display_board(board):
+    if not INTERACTIVE:
+        return
     clear_output()
     #print('TIC TAC TOE')
     print('\n')
@@ -27,16 +33,19 @@ def player_input():
 def place_marker(board,marker,position):
     board[position] = marker
 
+# every winning line as board positions
+WINS = ((7,8,9), # across the top
+        (4,5,6), # across the middle
+        (1,2,3), # across the bottom
+        (7,4,1), # down the left side
+        (8,5,2), # down the middle
+        (9,6,3), # down the right side
+        (7,5,3), # diagonal
+        (9,5,1)) # diagonal
+
 def win_check(board,mark):
     
-     return((board[7] == mark and board[8] == mark and board[9] == mark) or # across the top
-    (board[4] == mark and board[5] == mark and board[6] == mark) or # across the middle
-    (board[1] == mark and board[2] == mark and board[3] == mark) or # across the bottom
-    (board[7] == mark and board[4] == mark and board[1] == mark) or # down the middle
-    (board[8] == mark and board[5] == mark and board[2] == mark) or # down the middle
-    (board[9] == mark and board[6] == mark and board[3] == mark) or # down the right side
-    (board[7] == mark and board[5] == mark and board[3] == mark) or # diagonal
-    (board[9] == mark and board[5] == mark and board[1] == mark)) # diagonal
+    return any(board[a] == mark and board[b] == mark and board[c] == mark for a,b,c in WINS)
     
 def choose_first():
     